@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
+import sys
 import asyncio
 from argparse import ArgumentParser, Namespace
 
 from . import logging
 from .torrentrss import TorrentRSS
-from .constants import VERSION, CONFIG_PATH, CONFIG_SCHEMA
+from .constants import VERSION, config_path, config_schema_json
 from .utils import show_exception_notification
 
 
@@ -38,8 +38,7 @@ async def _main() -> None:
         return
 
     if arguments.schema:
-        schema = json.dumps(CONFIG_SCHEMA, indent=2, sort_keys=False)
-        print(schema)
+        sys.stdout.buffer.write(config_schema_json())
         return
 
     logging.configure(level=arguments.logging_level)
@@ -48,14 +47,14 @@ async def _main() -> None:
     try:
         app = await TorrentRSS.from_path()
     except FileNotFoundError:
-        message = f'No config file found at {str(CONFIG_PATH)!r}. ' \
+        message = f'No config file found at {str(config_path())!r}. ' \
             + "See '--schema' for reference."
         parser.error(message)
 
     try:
         await app.run()
     except Exception as error:
-        await logging.exception(error.__class__.__name__)
+        logging.exception(error.__class__.__name__)
         await show_exception_notification(error)
         parser.exit(2)
 
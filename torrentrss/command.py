@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import re
-from typing import Optional, List, Iterator, Match, cast
+from typing import Optional, List, Iterator, cast
 from subprocess import STARTUPINFO, STARTF_USESHOWWINDOW
 
 from . import logging
@@ -19,24 +18,14 @@ class Command:
         return f'{self.__class__.__name__}(arguments={self.arguments})'
 
     def subbed_arguments(self, url: str) -> Iterator[str]:
-        # The repl parameter here is a function which at first looks like it
-        # could just be a string, but it actually needs to be a function or
-        # else escapes in the string would be processed, leading to problems
-        # when dealing with file paths, for example.
-        # See: https://docs.python.org/3/library/re.html#re.sub
-        #      https://stackoverflow.com/a/16291763/3289208
-        def replacer(_: Match) -> str:
-            return url
+        # the placeholder is a plain substring, so str.replace does the job
+        # without the regex engine, and without processing escapes in the url
         for argument in cast(List[str], self.arguments):
-            yield re.sub(
-                pattern=re.escape(COMMAND_URL_ARGUMENT),
-                repl=replacer,
-                string=argument
-            )
+            yield argument.replace(COMMAND_URL_ARGUMENT, url)
 
     async def __call__(self, url: str) -> None:
         if self.arguments is None:
-            await logging.info(f'Launching {url!r} with default program')
+            logging.info('Launching %r with default program', url)
             await open_with_default_application(url)
         else:
             arguments = list(self.subbed_arguments(url))
@@ -47,9 +36,12 @@ class Command:
             else:
                 startupinfo = None
 
-            await logging.info(
-                f'Launching subprocess with arguments {arguments}'
+            logging.info(
+                'Launching subprocess with arguments %s', arguments
             )
+            # log lines are written in batches, so make sure this one is out
+            # before the command's own output
+            logging.flush()
             await run_subprocess(
                 args=arguments,
                 startupinfo=startupinfo
@@ -2,20 +2,35 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-
-import appdirs
+from functools import lru_cache
+from typing import Any, Callable, Final
 
 
 NAME = 'torrentrss'
 VERSION = '0.9.0'
-CONFIG_PATH = Path(
-    appdirs.user_config_dir(appname=NAME, roaming=True),
-    'config.json'
-)
 LOG_MESSAGE_FORMAT = '[%(asctime)s %(levelname)s] %(message)s'
 COMMAND_URL_ARGUMENT = '$URL'
 TORRENT_MIMETYPE = 'application/x-bittorrent'
-WINDOWS = sys.platform == 'win32' or sys.platform == 'cygwin'
+WINDOWS: Final[bool] = sys.platform in ('win32', 'cygwin')
+
+
+# appdirs is only imported, and the path only worked out, when it is first
+# needed, rather than whenever anything imports this module
+@lru_cache(maxsize=None)
+def config_path() -> Path:
+    import appdirs
+    return Path(
+        appdirs.user_config_dir(appname=NAME, roaming=True),
+        'config.json'
+    )
+
+
+# keeps CONFIG_PATH working for anything still importing it
+def __getattr__(name: str) -> Path:
+    if name == 'CONFIG_PATH':
+        return config_path()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 CONFIG_SCHEMA = {
     "$schema": "http://json-schema.org/draft-04/schema#",
@@ -47,6 +62,18 @@ CONFIG_SCHEMA = {
                             "description": "User agent used to send the GET request to download the feed. If missing, the global 'default_user_agent' is used.",
                             "type": "string"
                         },
+                        "etag": {
+                            "description": "The ETag header from the last time the feed was downloaded. Like 'last_modified' below, this is updated automatically and sent back to the server so that an unchanged feed isn't downloaded again. Should be left alone.",
+                            "type": "string"
+                        },
+                        "last_modified": {
+                            "description": "The Last-Modified header from the last time the feed was downloaded. See 'etag', as the same applies here.",
+                            "type": "string"
+                        },
+                        "subscriptions_hash": {
+                            "description": "A hash of the feed's subscriptions from the last time the feed was downloaded. 'etag' and 'last_modified' are only sent if the subscriptions haven't changed since, so that a new subscription, or one whose episode number was lowered, is checked against the whole feed again. Updated automatically and should be left alone.",
+                            "type": "string"
+                        },
                         "subscriptions": {
                             "type": "object",
                             "patternProperties": {
@@ -72,6 +99,10 @@ CONFIG_SCHEMA = {
                                                 "type": "string"
                                             },
                                             "minItems": 1
+                                        },
+                                        "ascii_regex": {
+                                            "description": "Make '\\w', '\\d', '\\s' and '\\b' in 'pattern' match only ASCII characters, which is faster on long titles. Only use this if the parts of the titles those match are plain ASCII. Defaults to false.",
+                                            "type": "boolean"
                                         }
                                     },
                                     "required": [
@@ -93,3 +124,31 @@ CONFIG_SCHEMA = {
         "feeds"
     ]
 }
+
+
+# like config_path, orjson and the validator's library are only imported, and
+# the work done, when first needed, and then only once
+@lru_cache(maxsize=None)
+def config_schema_json() -> bytes:
+    import orjson
+    return orjson.dumps(
+        CONFIG_SCHEMA,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    )
+
+
+@lru_cache(maxsize=None)
+def _config_validator() -> Callable[[Any], Any]:
+    # fastjsonschema compiles the schema into a plain python function, which
+    # is several times faster than jsonschema interpreting it
+    try:
+        import fastjsonschema
+    except ImportError:
+        import jsonschema
+        jsonschema.Draft4Validator.check_schema(CONFIG_SCHEMA)
+        return jsonschema.Draft4Validator(CONFIG_SCHEMA).validate
+    return fastjsonschema.compile(CONFIG_SCHEMA)
+
+
+def validate_config(config: Any) -> None:
+    _config_validator()(config)
@@ -1,16 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, Match, Any
+from typing import Optional, Match, NamedTuple, Any
 
 
-class EpisodeNumber:
+class EpisodeNumber(NamedTuple):
     series: Optional[int]
     episode: Optional[int]
 
-    def __init__(self, series: Optional[int], episode: Optional[int]) -> None:
-        self.series = series
-        self.episode = episode
-
     @classmethod
     def from_regex_match(cls, match: Match) -> EpisodeNumber:
         groups = match.groupdict()
@@ -19,21 +15,37 @@ class EpisodeNumber:
             episode=int(groups['episode'])
         )
 
-    def __gt__(self, other: EpisodeNumber) -> bool:
-        if self.episode is None:
+    # ordering can't come from tuple, as either number may be None and a
+    # missing series number means series are ignored. EpisodeNumbers are also
+    # only equal to other EpisodeNumbers, not to any tuple of the same values.
+    def __gt__(self, other: EpisodeNumber) -> bool:  # type: ignore[override]
+        series, episode = self
+        other_series, other_episode = other
+        if episode is None:
             return False
-        if other.episode is None:
+        if other_episode is None:
             return True
-        if self.series is not None \
-                and other.series is not None \
-                and self.series != other.series:
-            return self.series > other.series
-        return self.episode > other.episode
+        if series is not None \
+                and other_series is not None \
+                and series != other_series:
+            return series > other_series
+        return episode > other_episode
+
+    def __lt__(self, other: EpisodeNumber) -> bool:  # type: ignore[override]
+        return EpisodeNumber.__gt__(other, self)
+
+    def __ge__(self, other: EpisodeNumber) -> bool:  # type: ignore[override]
+        return not EpisodeNumber.__gt__(other, self)
 
-    def __repr__(self) -> str:
-        return f'{self.__class__.__name__}(series={self.series}, episode={self.episode})'
+    def __le__(self, other: EpisodeNumber) -> bool:  # type: ignore[override]
+        return not EpisodeNumber.__gt__(self, other)
 
+    # returning NotImplemented would let tuple's own comparison answer
     def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, EpisodeNumber):
-            return NotImplemented
-        return self.series == other.series and self.episode == other.episode
+        return isinstance(other, EpisodeNumber) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return tuple.__hash__(self)
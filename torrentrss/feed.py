@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, AsyncIterator, Tuple
+import hashlib
+from io import BytesIO
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+from typing import Dict, Optional, AsyncIterator, Tuple, List, Callable
 
+import orjson
 from aiohttp import ClientSession
 from feedparser import FeedParserDict, parse as parse_feed
 
@@ -13,11 +18,95 @@ from .subscription import Subscription
 from .episode_number import EpisodeNumber
 
 
+_ATOM_NAMESPACE = '{http://www.w3.org/2005/Atom}'
+
+
+def _element_text(element: Optional[Element]) -> str:
+    return '' if element is None else ''.join(element.itertext()).strip()
+
+
+def _rss_entry(item: Element) -> FeedParserDict:
+    link = _element_text(item.find('link'))
+    links = (
+        [FeedParserDict(rel='alternate', type='text/html', href=link)]
+        if link else []
+    )
+    for enclosure in item.iterfind('enclosure'):
+        links.append(FeedParserDict(
+            rel='enclosure',
+            type=enclosure.get('type', ''),
+            href=enclosure.get('url', '')
+        ))
+    return FeedParserDict(
+        title=_element_text(item.find('title')),
+        link=link,
+        links=links
+    )
+
+
+def _atom_entry(entry: Element) -> FeedParserDict:
+    links = [
+        FeedParserDict(
+            rel=link.get('rel', 'alternate'),
+            type=link.get('type', 'text/html'),
+            href=link.get('href', '')
+        )
+        for link in entry.iterfind(f'{_ATOM_NAMESPACE}link')
+    ]
+    return FeedParserDict(
+        title=_element_text(entry.find(f'{_ATOM_NAMESPACE}title')),
+        link=next(
+            (link['href'] for link in links if link['rel'] == 'alternate'),
+            ''
+        ),
+        links=links
+    )
+
+
+def _iterparse_feed(content: bytes) -> Optional[FeedParserDict]:
+    # feedparser spends most of its time sanitising html, resolving relative
+    # urls and parsing dates, none of which is needed to match titles. plain
+    # RSS 2.0 and Atom feeds are read with iterparse instead, pulling out only
+    # the titles and links. returns None for anything else, so that feedparser
+    # can have a go at it.
+    events = ElementTree.iterparse(BytesIO(content), events=('start', 'end'))
+    entries: List[FeedParserDict] = []
+    make_entry: Callable[[Element], FeedParserDict]
+    try:
+        _, root = next(events)
+        if root.tag == 'rss':
+            entry_tag, make_entry = 'item', _rss_entry
+        elif root.tag == f'{_ATOM_NAMESPACE}feed':
+            entry_tag, make_entry = f'{_ATOM_NAMESPACE}entry', _atom_entry
+        else:
+            return None
+        for event, element in events:
+            if event == 'end' and element.tag == entry_tag:
+                entries.append(make_entry(element))
+                element.clear()
+    except ElementTree.ParseError:
+        return None
+    return FeedParserDict(bozo=False, entries=entries)
+
+
+def hash_subscriptions(subscriptions: Json) -> str:
+    # stored with the etag and last modified date, so that they are only sent
+    # if the subscriptions haven't changed since. otherwise the server would
+    # say the feed is unchanged, and a new subscription, or one whose number
+    # was lowered, would never be checked against the entries already in it.
+    return hashlib.sha256(
+        orjson.dumps(subscriptions, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
 class Feed:
     subscriptions: Dict[str, Subscription]
     name: str
     url: str
     user_agent: Optional[str]
+    headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
 
     def __init__(
         self, *,
@@ -25,6 +114,9 @@ class Feed:
         url: str,
         subscriptions: Json,
         user_agent: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        subscriptions_hash: Optional[str] = None
     ) -> None:
         self.name = name
         self.url = url
@@ -33,87 +125,132 @@ class Feed:
             for name, sub_dict in subscriptions.items()
         }
         self.user_agent = user_agent
+        self.headers = {} if user_agent is None else {'User-Agent': user_agent}
+        if (etag is not None or last_modified is not None) \
+                and subscriptions_hash != hash_subscriptions(subscriptions):
+            etag = last_modified = None
+        self.etag = etag
+        self.last_modified = last_modified
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(name={self.name!r}, url={self.url!r})'
 
-    async def fetch(self) -> FeedParserDict:
-        headers = (
-            {} if self.user_agent is None else
-            {'User-Agent': self.user_agent}
-        )
-        async with ClientSession(headers=headers) as session:
-            async with session.get(self.url) as response:
-                if response.status != 200:
-                    raise FeedError(
-                        f'Feed {self.name!r}: error sending '
-                        + f'request to {self.url!r}'
-                    )
-                text = await response.text()
+    # returns None if the feed hasn't changed since the last fetch
+    async def fetch(self, session: ClientSession) -> Optional[FeedParserDict]:
+        headers = self.headers
+        if self.etag is not None or self.last_modified is not None:
+            headers = headers.copy()
+            if self.etag is not None:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified is not None:
+                headers['If-Modified-Since'] = self.last_modified
+        async with session.get(self.url, headers=headers) as response:
+            if response.status == 304:
+                logging.info(
+                    'Feed %r: url %r not modified', self.name, self.url
+                )
+                return None
+            if response.status != 200:
+                raise FeedError(
+                    f'Feed {self.name!r}: error sending '
+                    + f'request to {self.url!r}'
+                )
+            content = await response.read()
+            content_type = response.headers.get('Content-Type', '')
+            charset = response.charset
+            self.etag = response.headers.get('ETag')
+            self.last_modified = response.headers.get('Last-Modified')
 
-        rss = parse_feed(text)
-        if rss['bozo']:
-            raise FeedError(
-                f'Feed {self.name!r}: error parsing url {self.url!r}'
-            ) from rss['bozo_exception']
+        # iterparse only knows about the encoding in the xml declaration, so
+        # a feed whose charset is only given in the http header is left to
+        # feedparser, which is passed the header to use it
+        rss = None
+        if charset is None or charset.lower() in ('utf-8', 'utf8'):
+            rss = _iterparse_feed(content)
+        if rss is None:
+            rss = parse_feed(
+                content,
+                response_headers={'content-type': content_type}
+            )
+            if rss['bozo']:
+                raise FeedError(
+                    f'Feed {self.name!r}: error parsing url {self.url!r}'
+                ) from rss['bozo_exception']
 
-        await logging.info(f'Feed {self.name!r}: downloaded url {self.url!r}')
+        logging.info(
+            'Feed %r: downloaded url %r', self.name, self.url
+        )
         return rss
 
-    async def matching_subs(self) -> AsyncIterator[Tuple[Subscription, FeedParserDict]]:
+    async def matching_subs(
+        self,
+        session: ClientSession
+    ) -> AsyncIterator[Tuple[Subscription, FeedParserDict]]:
         if not self.subscriptions:
             return
 
-        rss = await self.fetch()
+        rss = await self.fetch(session)
+        if rss is None:
+            return
         # episode numbers are compared against subscriptions' numbers as they
         # were at the beginning of the method rather than comparing to the most
         # recent match. this ensures that all matches in the feed are yielded
-        # regardless of whether they are in numeric order.
-        original_numbers = {
-            sub: sub.number for sub in
+        # regardless of whether they are in numeric order. each sub's regex is
+        # looked up here along with it, rather than once per entry.
+        subs = [
+            (sub, sub.regex, sub.number) for sub in
             self.subscriptions.values()
-        }
+        ]
+        # user patterns can't be merged into one alternation, as the same
+        # group names repeat across them and several subs may match one entry.
+        # subs sharing a pattern do share a compiled regex though, so only
+        # search each distinct regex once per entry.
+        searches = [
+            (regex, regex.search) for regex in
+            dict.fromkeys(regex for _, regex, _ in subs)
+        ]
 
-        for index, entry in enumerate(reversed(rss['entries'])):
-            index = len(rss['entries']) - index - 1
-            for sub in self.subscriptions.values():
-                match = sub.regex.search(entry['title'])
+        entries = rss['entries']
+        for index in range(len(entries) - 1, -1, -1):
+            entry = entries[index]
+            title = entry['title']
+            matches = {regex: search(title) for regex, search in searches}
+            for sub, regex, original_number in subs:
+                match = matches[regex]
                 if match:
                     number = EpisodeNumber.from_regex_match(match)
-                    if number > original_numbers[sub]:
-                        await logging.info(
-                            f'MATCH: entry {index} {entry["title"]!r} has '
-                            + f'greater number than sub {sub.name!r}: '
-                            + f'{number} > {original_numbers[sub]}'
+                    if number > original_number:
+                        logging.info(
+                            'MATCH: entry %d %r has greater number than sub '
+                            + '%r: %s > %s',
+                            index, title, sub.name, number, original_number
                         )
                         sub.number = number
                         yield sub, entry
                     else:
-                        await logging.debug(
-                            f'NO MATCH: entry {index} {entry["title"]!r} '
-                            + 'matches but number less than or equal to sub '
-                            + f'{sub.name!r}: {number} <= '
-                            + f'{original_numbers[sub]}'
+                        logging.debug(
+                            'NO MATCH: entry %d %r matches but number less '
+                            + 'than or equal to sub %r: %s <= %s',
+                            index, title, sub.name, number, original_number
                         )
                 else:
-                    await logging.debug(
-                        f'NO MATCH: entry {index} {entry["title"]!r} against '
-                        + f'sub {sub.name!r}'
+                    logging.debug(
+                        'NO MATCH: entry %d %r against sub %r',
+                        index, title, sub.name
                     )
 
     @staticmethod
     async def get_entry_url(rss_entry: FeedParserDict) -> str:
         for link in rss_entry['links']:
             if link['type'] == TORRENT_MIMETYPE:
-                await logging.debug(
-                    f'Entry {rss_entry["title"]!r}: first link with mimetype '
-                    + f'{TORRENT_MIMETYPE!r} is {link["href"]!r}'
+                logging.debug(
+                    'Entry %r: first link with mimetype %r is %r',
+                    rss_entry['title'], TORRENT_MIMETYPE, link['href']
                 )
                 return link['href']
 
-        await logging.info(
-            f'Entry {rss_entry["title"]!r}: no link with mimetype '
-            + f'{TORRENT_MIMETYPE!r}, returning first link '
-            + f'{rss_entry["link"]!r}'
+        logging.info(
+            'Entry %r: no link with mimetype %r, returning first link %r',
+            rss_entry['title'], TORRENT_MIMETYPE, rss_entry['link']
         )
         return rss_entry['link']
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import sys
-from typing import Literal, Union
-from logging import Logger, StreamHandler, Formatter
+import atexit
+from queue import SimpleQueue
+from threading import Event
+from typing import Literal, Union, TextIO, Optional, Any
+from logging import (
+    Logger, Formatter, NullHandler, DEBUG, INFO, WARNING, ERROR, CRITICAL
+)
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler
 
-from .utils import wrap_for_asyncio
 from .constants import NAME, LOG_MESSAGE_FORMAT
 
 
@@ -19,18 +24,131 @@ Level = Union[
 
 
 _logger = Logger(name=NAME)
+_formatter = Formatter(fmt=LOG_MESSAGE_FORMAT)
+_queue: Optional[SimpleQueue] = None
+
+
+class _BatchStreamHandler(MemoryHandler):
+    # records are buffered until there are enough of them, or one is a
+    # warning or worse, and then the whole batch is written to the stream with
+    # a single write and flush. a MemoryHandler targeting a StreamHandler
+    # would still write and flush once per record.
+    stream: TextIO
+
+    def __init__(self, stream: TextIO, capacity: int, flushLevel: int) -> None:
+        super().__init__(capacity=capacity, flushLevel=flushLevel)
+        self.stream = stream
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if not self.buffer:
+                return
+            records = []
+            lines = []
+            for record in self.buffer:
+                try:
+                    lines.append(self.format(record) + '\n')
+                    records.append(record)
+                except Exception:
+                    self.handleError(record)
+            self.buffer.clear()
+            try:
+                self.stream.write(''.join(lines))
+                self.stream.flush()
+            except Exception:
+                # like StreamHandler.emit, errors writing are reported rather
+                # than raised, which would kill the listener's thread. each
+                # record is tried on its own, so that one that can't be
+                # encoded doesn't lose the rest of the batch.
+                for record, line in zip(records, lines):
+                    try:
+                        self.stream.write(line)
+                        self.stream.flush()
+                    except Exception:
+                        self.handleError(record)
+        finally:
+            self.release()
+
+
+class _FlushingQueueListener(QueueListener):
+    # an event put on the queue instead of a record asks for the handlers to
+    # be flushed, and is set once everything before it has been written
+    def handle(self, record: Any) -> None:
+        if isinstance(record, Event):
+            try:
+                for handler in self.handlers:
+                    handler.flush()
+            finally:
+                record.set()
+        else:
+            super().handle(record)
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+def flush() -> None:
+    # waits until everything logged so far has been written, for when
+    # something else is about to write to stdout, like a launched command
+    if _queue is None:
+        return
+    done = Event()
+    _queue.put(done)
+    done.wait()
 
 
 def configure(level: Level) -> None:
-    handler = StreamHandler(stream=sys.stdout)
+    global debug, info, warning, error, exception, _queue
+    if level == 'DISABLE':
+        # nothing will ever be logged, so skip the handler and listener
+        # entirely and make every logging function a no-op
+        _logger.addHandler(NullHandler())
+        _logger.setLevel(CRITICAL + 1)
+        _logger.disabled = True
+        debug = info = warning = error = exception = _noop
+        return
+
+    handler = _BatchStreamHandler(
+        stream=sys.stdout,
+        capacity=512,
+        flushLevel=WARNING
+    )
     handler.setLevel(level)
-    handler.setFormatter(Formatter(fmt=LOG_MESSAGE_FORMAT))
+    handler.setFormatter(_formatter)
+
+    # the logger only puts records on a queue, and the listener's thread
+    # writes them out, so logging never waits on stdout. atexit runs these in
+    # reverse, so the listener drains the queue before the last batch is
+    # flushed.
+    _queue = SimpleQueue()
+    listener = _FlushingQueueListener(
+        _queue,
+        handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(handler.close)
+    atexit.register(listener.stop)
+
     _logger.setLevel(level)
-    _logger.addHandler(handler)
+    _logger.addHandler(QueueHandler(_queue))
+
+    # the level never changes after this, so functions for filtered levels
+    # are bound to a no-op once here rather than checking it on every call
+    enabled = _logger.isEnabledFor
+    debug = _logger.debug if enabled(DEBUG) else _noop
+    info = _logger.info if enabled(INFO) else _noop
+    warning = _logger.warning if enabled(WARNING) else _noop
+    error = _logger.error if enabled(ERROR) else _noop
+    exception = _logger.exception if enabled(ERROR) else _noop
 
 
-debug = wrap_for_asyncio(_logger.debug)
-info = wrap_for_asyncio(_logger.info)
-warning = wrap_for_asyncio(_logger.warning)
-error = wrap_for_asyncio(_logger.error)
-exception = wrap_for_asyncio(_logger.exception)
+# logging only puts records on the listener's queue, which never blocks, so
+# these are called directly rather than being run in an executor
+debug = _logger.debug
+info = _logger.info
+warning = _logger.warning
+error = _logger.error
+exception = _logger.exception
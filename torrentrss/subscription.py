@@ -9,6 +9,47 @@ from .episode_number import EpisodeNumber
 if TYPE_CHECKING:
     from .feed import Feed
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+    _RE2_OPTIONS = None
+else:
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+
+# re's versions of these match any unicode character of the class, but re2's
+# only ever match ascii
+_UNICODE_CLASSES = frozenset('wWdDsSbB')
+
+
+def _has_unicode_classes(pattern: str) -> bool:
+    # an escaped backslash is skipped over along with the character after it
+    index = pattern.find('\\')
+    while index != -1:
+        if pattern[index + 1:index + 2] in _UNICODE_CLASSES:
+            return True
+        index = pattern.find('\\', index + 2)
+    return False
+
+
+def _compile(pattern: str, flags: int = 0) -> Pattern:
+    # re2 matches in linear time, so a bad pattern can't hang on a long title.
+    # it doesn't support everything re does, like lookarounds and
+    # backreferences, so fall back to re for those (and to get re's error
+    # messages for invalid patterns). it's also only used for patterns that
+    # would match the same with it, so installing it never changes what an
+    # existing pattern matches: ones using \w, \d, \s or \b are left to re,
+    # unless the subscription asked for ascii matching with re.ASCII anyway.
+    if re2 is not None \
+            and (flags & re.ASCII or not _has_unicode_classes(pattern)):
+        try:
+            return re2.compile(pattern, _RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 
 class Subscription:
     feed: Feed
@@ -24,13 +65,14 @@ class Subscription:
         pattern: str,
         series_number: Optional[int] = None,
         episode_number: Optional[int] = None,
-        command: Optional[List[str]] = None
+        command: Optional[List[str]] = None,
+        ascii_regex: bool = False
     ) -> None:
         self.feed = feed
         self.name = name
 
         try:
-            self.regex = re.compile(pattern)
+            self.regex = _compile(pattern, re.ASCII if ascii_regex else 0)
         except re.error as error:
             args = ", ".join(error.args)
             raise ConfigError(
@@ -4,7 +4,7 @@ from feedparser import FeedParserDict, parse
 from .utils import local_path
 from ..feed import Feed
 from ..torrentrss import TorrentRSS
-from ..utils import read_text
+from ..utils import read_bytes
 
 
 @pytest.fixture
@@ -19,5 +19,5 @@ def feed(config: TorrentRSS) -> Feed:
 
 @pytest.fixture
 async def rss() -> FeedParserDict:
-    text = await read_text(local_path('./testfeed.xml'))
-    return parse(text)
+    content = await read_bytes(local_path('./testfeed.xml'))
+    return parse(content)
@@ -24,3 +24,9 @@ async def test_no_arguments() -> None:
     with patch('torrentrss.command.open_with_default_application') as mock:
         await command('http://test.com/test.torrent')
         mock.assert_called_once_with('http://test.com/test.torrent')
+
+
+def test_subbed_arguments_escapes() -> None:
+    command = Command(['command', '--path=$URL'])
+    arguments = list(command.subbed_arguments(r'C:\test\1.torrent'))
+    assert arguments == ['command', r'--path=C:\test\1.torrent']
@@ -12,6 +12,23 @@ def test_comparison() -> None:
     assert not EpisodeNumber(None, None) > EpisodeNumber(1, 1)
     assert EpisodeNumber(2, 1) > EpisodeNumber(1, 2)
     assert not EpisodeNumber(1, 2) > EpisodeNumber(2, 1)
+    assert EpisodeNumber(1, 2) < EpisodeNumber(2, 1)
+    assert EpisodeNumber(None, 5) >= EpisodeNumber(1, 3)
+    assert not EpisodeNumber(None, 5) <= EpisodeNumber(1, 3)
+    assert EpisodeNumber(None, None) >= EpisodeNumber(None, None)
+    assert EpisodeNumber(None, None) <= EpisodeNumber(None, None)
+    assert not EpisodeNumber(None, None) >= EpisodeNumber(1, 1)
+    assert EpisodeNumber(2, 3) >= EpisodeNumber(None, 3)
+    assert EpisodeNumber(2, 3) <= EpisodeNumber(None, 3)
+
+
+def test_equality() -> None:
+    assert EpisodeNumber(1, 2) == EpisodeNumber(1, 2)
+    assert EpisodeNumber(1, 2) != EpisodeNumber(None, 2)
+    assert EpisodeNumber(1, 2) != (1, 2)
+    assert not EpisodeNumber(1, 2) == (1, 2)
+    assert not (1, 2) == EpisodeNumber(1, 2)
+    assert hash(EpisodeNumber(1, 2)) == hash(EpisodeNumber(1, 2))
 
 
 def test_from_regex() -> None:
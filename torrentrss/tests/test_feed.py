@@ -1,11 +1,12 @@
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 import pytest
 from feedparser import FeedParserDict
 
-from ..feed import Feed
+from ..feed import Feed, hash_subscriptions, _iterparse_feed
+from ..utils import Json
 from ..episode_number import EpisodeNumber
-from .utils import task_mock
+from .utils import task_mock, local_path, session_mock
 
 
 @pytest.mark.asyncio
@@ -13,6 +14,7 @@ async def test_properties(feed: Feed) -> None:
     assert feed.name == 'Test feed 1'
     assert feed.url == 'https://test.com/rss'
     assert feed.user_agent is None
+    assert feed.headers == {}
     assert 'Test sub 1' in feed.subscriptions
     assert 'Test sub 2' in feed.subscriptions
 
@@ -21,7 +23,7 @@ async def test_properties(feed: Feed) -> None:
 async def test_matching_subs(feed: Feed, rss: FeedParserDict) -> None:
     with patch.object(feed, 'fetch', return_value=task_mock(rss)):
         matches = []
-        async for match in feed.matching_subs():
+        async for match in feed.matching_subs(MagicMock()):
             matches.append(match)
 
     sub1 = feed.subscriptions['Test sub 1']
@@ -45,3 +47,79 @@ async def test_matching_subs(feed: Feed, rss: FeedParserDict) -> None:
 async def test_get_entry_url(rss: FeedParserDict) -> None:
     result = await Feed.get_entry_url(rss.entries[0])
     assert result == 'https://test.rss/20.torrent'
+
+
+def test_iterparse_feed(rss: FeedParserDict) -> None:
+    result = _iterparse_feed(local_path('./testfeed.xml').read_bytes())
+    assert result is not None
+    assert len(result.entries) == len(rss.entries)
+    for entry, expected in zip(result.entries, rss.entries):
+        assert entry.title == expected.title
+        assert entry.link == expected.link
+        assert entry.links == expected.links
+
+
+def test_iterparse_feed_unsupported() -> None:
+    assert _iterparse_feed(b'<html><body></body></html>') is None
+    assert _iterparse_feed(b'<rss><channel>') is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_header_charset(feed: Feed) -> None:
+    content = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>'
+        + '<item><title>Caf\xe9 S01E01</title>'
+        + '<link>https://test.rss/1.torrent</link></item></channel></rss>'
+    ).encode('latin-1')
+    session = session_mock(
+        content=content,
+        headers={'Content-Type': 'application/xml; charset=ISO-8859-1'},
+        charset='ISO-8859-1'
+    )
+    rss = await feed.fetch(session)
+    assert rss is not None
+    assert rss.entries[0].title == 'Caf\xe9 S01E01'
+
+
+@pytest.mark.asyncio
+async def test_fetch_not_modified(feed: Feed) -> None:
+    feed.etag = '"test etag"'
+    feed.last_modified = 'Tue, 09 Jan 2018 20:26:54 GMT'
+    session = session_mock(status=304)
+
+    matches = []
+    async for match in feed.matching_subs(session):
+        matches.append(match)
+
+    assert matches == []
+    headers = session.get.call_args.kwargs['headers']
+    assert headers['If-None-Match'] == '"test etag"'
+    assert headers['If-Modified-Since'] == 'Tue, 09 Jan 2018 20:26:54 GMT'
+    assert feed.headers == {}
+
+
+def test_cache_headers_dropped_when_subs_change() -> None:
+    subscriptions: Json = {
+        'Test sub': {'pattern': 'S01E(?P<episode>[0-9]{2})'}
+    }
+    subscriptions_hash = hash_subscriptions(subscriptions)
+    feed = Feed(
+        name='Test feed',
+        url='https://test.com/rss',
+        subscriptions=subscriptions,
+        etag='"test etag"',
+        subscriptions_hash=subscriptions_hash
+    )
+    assert feed.etag == '"test etag"'
+
+    subscriptions['Test sub']['episode_number'] = 1
+    feed = Feed(
+        name='Test feed',
+        url='https://test.com/rss',
+        subscriptions=subscriptions,
+        etag='"test etag"',
+        last_modified='Tue, 09 Jan 2018 20:26:54 GMT',
+        subscriptions_hash=subscriptions_hash
+    )
+    assert feed.etag is None
+    assert feed.last_modified is None
@@ -0,0 +1,102 @@
+import sys
+from io import StringIO, BytesIO, TextIOWrapper
+from logging import Logger
+from threading import Thread
+
+import pytest
+
+from .. import logging
+from ..constants import NAME
+
+
+@pytest.fixture(autouse=True)
+def logger(monkeypatch: pytest.MonkeyPatch) -> Logger:
+    # configure() changes module state, so give each test a fresh logger and
+    # put the module's functions back afterwards
+    logger = Logger(name=NAME)
+    monkeypatch.setattr(logging, '_logger', logger)
+    for name in ('debug', 'info', 'warning', 'error', 'exception', '_queue'):
+        monkeypatch.setattr(logging, name, getattr(logging, name))
+    return logger
+
+
+def test_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = StringIO()
+    monkeypatch.setattr(sys, 'stdout', stream)
+    logging.configure('INFO')
+
+    logging.info('Test %s', 'message')
+    logging.flush()
+    assert stream.getvalue().endswith(' INFO] Test message\n')
+
+
+def test_configure_disable(logger: Logger) -> None:
+    logging.configure('DISABLE')
+
+    assert logger.disabled
+    assert logging._queue is None
+    for function in (
+        logging.debug,
+        logging.info,
+        logging.warning,
+        logging.error,
+        logging.exception
+    ):
+        assert function is logging._noop
+    logging.error('Test %s', 'message')
+
+
+def test_configure_filtered_levels(
+    logger: Logger,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, 'stdout', StringIO())
+    logging.configure('WARNING')
+
+    assert logging.debug is logging._noop
+    assert logging.info is logging._noop
+    assert logging.warning == logger.warning
+    assert logging.error == logger.error
+    assert logging.exception == logger.exception
+
+
+class _BrokenStream(StringIO):
+    def write(self, text: str) -> int:
+        raise BrokenPipeError
+
+
+def _flush_returns() -> bool:
+    thread = Thread(target=logging.flush, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    return not thread.is_alive()
+
+
+def test_flush_write_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, 'stdout', _BrokenStream())
+    errors = StringIO()
+    monkeypatch.setattr(sys, 'stderr', errors)
+    logging.configure('INFO')
+
+    logging.info('Test %s', 'message')
+    assert _flush_returns()
+    assert 'Logging error' in errors.getvalue()
+    # the listener is still running
+    logging.info('Test %s', 'message')
+    assert _flush_returns()
+
+
+def test_flush_encode_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = TextIOWrapper(BytesIO(), encoding='ascii')
+    monkeypatch.setattr(sys, 'stdout', stream)
+    errors = StringIO()
+    monkeypatch.setattr(sys, 'stderr', errors)
+    logging.configure('INFO')
+
+    logging.info('Test %s', 'caf\xe9')
+    logging.info('Test %s', 'message')
+    assert _flush_returns()
+    output = stream.buffer.getvalue()
+    assert b'caf' not in output
+    assert output.endswith(b' INFO] Test message\n')
+    assert 'UnicodeEncodeError' in errors.getvalue()
@@ -1,3 +1,4 @@
+import re
 from unittest.mock import MagicMock
 
 import pytest
@@ -30,3 +31,86 @@ def test_invalid_regex(pattern) -> None:
             name='test subscription',
             pattern=pattern
         )
+
+
+def test_ascii_regex() -> None:
+    sub = Subscription(
+        feed=MagicMock(),
+        name='test subscription',
+        pattern=r'(?P<episode>\w+)',
+        ascii_regex=True
+    )
+
+    match = sub.regex.search('é1')
+    assert match is not None
+    assert match.group('episode') == '1'
+
+
+def test_re2() -> None:
+    re2 = pytest.importorskip('re2')
+    sub = Subscription(
+        feed=MagicMock(),
+        name='test subscription',
+        pattern=r'S(?P<series>[0-9]{2})E(?P<episode>[0-9]{2})'
+    )
+
+    assert isinstance(sub.regex, re2._Regexp)
+    assert 'episode' in sub.regex.groupindex
+    match = sub.regex.search('Test Show S02E05')
+    assert match is not None
+    assert match.groupdict() == {'series': '02', 'episode': '05'}
+    assert EpisodeNumber.from_regex_match(match) == EpisodeNumber(2, 5)
+
+
+@pytest.mark.parametrize('pattern', (
+    r'(?P<title>\w+) - (?P<episode>[0-9]+)',
+    r'Test - (?P<episode>\d+)',
+    r'\bTest - (?P<episode>[0-9]+)',
+    r'Test\s-\s(?P<episode>[0-9]+)',
+))
+def test_re2_unicode_classes(pattern: str) -> None:
+    pytest.importorskip('re2')
+    sub = Subscription(
+        feed=MagicMock(),
+        name='test subscription',
+        pattern=pattern
+    )
+
+    assert isinstance(sub.regex, re.Pattern)
+
+
+def test_re2_ascii_regex() -> None:
+    re2 = pytest.importorskip('re2')
+    sub = Subscription(
+        feed=MagicMock(),
+        name='test subscription',
+        pattern=r'(?P<title>\w+) - (?P<episode>\d+)',
+        ascii_regex=True
+    )
+
+    assert isinstance(sub.regex, re2._Regexp)
+
+
+def test_re2_escaped_backslash() -> None:
+    re2 = pytest.importorskip('re2')
+    sub = Subscription(
+        feed=MagicMock(),
+        name='test subscription',
+        pattern=r'C:\\downloads (?P<episode>[0-9]+)'
+    )
+
+    assert isinstance(sub.regex, re2._Regexp)
+
+
+def test_re2_fallback(capfd: pytest.CaptureFixture) -> None:
+    pytest.importorskip('re2')
+    sub = Subscription(
+        feed=MagicMock(),
+        name='test subscription',
+        pattern=r'(?<!Not )Test (?P<episode>[0-9]+)'
+    )
+
+    assert isinstance(sub.regex, re.Pattern)
+    assert sub.regex.search('Not Test 1') is None
+    # re2's own error logging is turned off
+    assert capfd.readouterr().err == ''
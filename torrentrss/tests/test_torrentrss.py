@@ -1,13 +1,13 @@
 import json
-from io import StringIO, SEEK_SET
-from unittest.mock import patch, call
+from io import BytesIO, SEEK_SET
+from unittest.mock import patch, call, AsyncMock
 
 import pytest
 from feedparser import FeedParserDict
 
 from ..torrentrss import TorrentRSS
 from ..episode_number import EpisodeNumber
-from ..feed import Feed
+from ..feed import Feed, hash_subscriptions
 from ..command import Command
 from .utils import task_mock
 
@@ -56,7 +56,7 @@ async def test_save_episode_numbers(config: TorrentRSS, rss: FeedParserDict):
     assert feed2['Test sub 3'].number == EpisodeNumber(3, 5)
     assert feed2['Sub matching nothing'].number == EpisodeNumber(None, None)
 
-    with StringIO() as file:
+    with BytesIO() as file:
         await config.save_episode_numbers(file)
         file.seek(SEEK_SET)
         json_dict = json.load(file)
@@ -75,3 +75,41 @@ async def test_save_episode_numbers(config: TorrentRSS, rss: FeedParserDict):
     assert feed2['Test sub 3']['episode_number'] == 5
     assert 'series_number' not in feed2['Sub matching nothing']
     assert 'episode_number' not in feed2['Sub matching nothing']
+
+
+@pytest.mark.asyncio
+async def test_save_feed_cache_headers(config: TorrentRSS) -> None:
+    feed1 = config.feeds['Test feed 1']
+    feed1.etag = '"test etag"'
+    feed1.last_modified = 'Tue, 09 Jan 2018 20:26:54 GMT'
+
+    with BytesIO() as file:
+        await config.save_episode_numbers(file)
+        file.seek(SEEK_SET)
+        json_dict = json.load(file)
+
+    feed1_dict = json_dict['feeds']['Test feed 1']
+    feed2_dict = json_dict['feeds']['Test feed 2']
+    assert feed1_dict['etag'] == '"test etag"'
+    assert feed1_dict['last_modified'] == 'Tue, 09 Jan 2018 20:26:54 GMT'
+    assert feed1_dict['subscriptions_hash'] \
+        == hash_subscriptions(feed1_dict['subscriptions'])
+    assert 'etag' not in feed2_dict
+    assert 'last_modified' not in feed2_dict
+    assert 'subscriptions_hash' not in feed2_dict
+
+    reloaded = TorrentRSS(config.path, json_dict).feeds['Test feed 1']
+    assert reloaded.etag == '"test etag"'
+    assert reloaded.last_modified == 'Tue, 09 Jan 2018 20:26:54 GMT'
+
+
+@pytest.mark.asyncio
+async def test_save_episode_numbers_unchanged(config: TorrentRSS) -> None:
+    with patch('torrentrss.torrentrss.write_bytes', new=AsyncMock()) as mock:
+        await config.save_episode_numbers()
+        mock.assert_not_called()
+
+        sub = config.feeds['Test feed 1'].subscriptions['Test sub 1']
+        sub.number = EpisodeNumber(3, 2)
+        await config.save_episode_numbers()
+        mock.assert_called_once()
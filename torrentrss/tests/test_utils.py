@@ -0,0 +1,46 @@
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ..utils import write_bytes
+
+
+@pytest.mark.asyncio
+async def test_write_bytes_keeps_mode(tmp_path: Path) -> None:
+    path = tmp_path / 'config.json'
+    path.write_bytes(b'{}')
+    path.chmod(0o600)
+
+    await write_bytes(path, b'{"feeds": {}}')
+
+    assert path.read_bytes() == b'{"feeds": {}}'
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+@pytest.mark.asyncio
+async def test_write_bytes_follows_symlink(tmp_path: Path) -> None:
+    target = tmp_path / 'target.json'
+    target.write_bytes(b'{}')
+    link = tmp_path / 'config.json'
+    link.symlink_to(target)
+
+    await write_bytes(link, b'{"feeds": {}}')
+
+    assert link.is_symlink()
+    assert target.read_bytes() == b'{"feeds": {}}'
+
+
+@pytest.mark.asyncio
+async def test_write_bytes_cleans_up(tmp_path: Path) -> None:
+    path = tmp_path / 'config.json'
+    path.write_bytes(b'{}')
+
+    with patch('torrentrss.utils.os.replace', side_effect=OSError):
+        with pytest.raises(OSError):
+            await write_bytes(path, b'{"feeds": {}}')
+
+    assert path.read_bytes() == b'{}'
+    assert os.listdir(tmp_path) == ['config.json']
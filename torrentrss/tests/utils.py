@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, Dict, Optional
 from pathlib import Path
 from asyncio import Future
+from unittest.mock import MagicMock, AsyncMock
 
 
 def task_mock(value: Any = None) -> Future:
@@ -11,3 +12,16 @@ def task_mock(value: Any = None) -> Future:
 
 def local_path(name: str) -> Path:
     return Path(__file__).with_name(name)
+
+
+def session_mock(
+    status: int = 200,
+    content: bytes = b'',
+    headers: Optional[Dict[str, str]] = None,
+    charset: Optional[str] = None
+) -> MagicMock:
+    response = MagicMock(status=status, headers=headers or {}, charset=charset)
+    response.read = AsyncMock(return_value=content)
+    session = MagicMock()
+    session.get.return_value.__aenter__.return_value = response
+    return session
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-import json
-from io import StringIO
+import asyncio
 from os import PathLike
-from typing import Dict, Optional
+from typing import Dict, Optional, List, Tuple, BinaryIO
 
-import jsonschema
+import orjson
+from aiohttp import ClientSession
 
 from . import logging
-from .feed import Feed
+from .feed import Feed, hash_subscriptions
 from .command import Command
-from .utils import Json, read_text, write_text
-from .constants import CONFIG_PATH, CONFIG_SCHEMA
+from .utils import Json, read_bytes, write_bytes
+from .constants import validate_config, config_path
 
 
 class TorrentRSS:
@@ -36,44 +36,86 @@ class TorrentRSS:
         }
 
     @classmethod
-    async def from_path(cls, path: PathLike = CONFIG_PATH) -> TorrentRSS:
-        config_text = await read_text(path)
-        config = json.loads(config_text)
-        jsonschema.validate(config, CONFIG_SCHEMA)
+    async def from_path(cls, path: Optional[PathLike] = None) -> TorrentRSS:
+        if path is None:
+            path = config_path()
+        config_bytes = await read_bytes(path)
+        config = orjson.loads(config_bytes)
+        validate_config(config)
 
         return cls(path, config)
 
-    async def check_feeds(self) -> None:
-        urls = [
+    async def feed_urls(
+        self,
+        feed: Feed,
+        session: ClientSession
+    ) -> List[Tuple[str, Command]]:
+        return [
             (
                 await Feed.get_entry_url(entry),
                 sub.command or self.default_command
             )
-            for feed in self.feeds.values()
-            async for sub, entry in feed.matching_subs()
+            async for sub, entry in feed.matching_subs(session)
         ]
-        for url, command in urls:
-            await command(url)
 
-    # Optional parameter for writing to a StringIO during testing
-    async def save_episode_numbers(self, file: Optional[StringIO] = None) -> None:
-        await logging.info('Writing episode numbers')
+    async def check_feeds(self) -> None:
+        # feeds are fetched concurrently, since the time is almost all spent
+        # waiting on the network. commands are still run one by one, in the
+        # order of the feeds. one session is shared between all the feeds so
+        # that connections to the same host are reused.
+        async with ClientSession() as session:
+            results = await asyncio.gather(*(
+                self.feed_urls(feed, session) for feed in self.feeds.values()
+            ))
+        for urls in results:
+            for url, command in urls:
+                await command(url)
 
+    # Optional parameter for writing to a BytesIO during testing
+    async def save_episode_numbers(self, file: Optional[BinaryIO] = None) -> None:
+        # only rewrite the config file if something in it actually changed
+        changed = False
         json_feeds = self.config['feeds']
         for feed_name, feed in self.feeds.items():
-            json_subs = json_feeds[feed_name]['subscriptions']
+            feed_dict = json_feeds[feed_name]
+            json_subs = feed_dict['subscriptions']
             for sub_name, sub in feed.subscriptions.items():
                 sub_dict = json_subs[sub_name]
-                if sub.number.series is not None:
-                    sub_dict['series_number'] = sub.number.series
-                if sub.number.episode is not None:
-                    sub_dict['episode_number'] = sub.number.episode
+                for number_key, number in (
+                    ('series_number', sub.number.series),
+                    ('episode_number', sub.number.episode)
+                ):
+                    if number is not None \
+                            and sub_dict.get(number_key) != number:
+                        changed = True
+                        sub_dict[number_key] = number
+
+            # the subscriptions are hashed as they are saved, see Feed
+            subscriptions_hash = None
+            if feed.etag is not None or feed.last_modified is not None:
+                subscriptions_hash = hash_subscriptions(json_subs)
+            for key, value in (
+                ('etag', feed.etag),
+                ('last_modified', feed.last_modified),
+                ('subscriptions_hash', subscriptions_hash)
+            ):
+                if feed_dict.get(key) != value:
+                    changed = True
+                    if value is None:
+                        del feed_dict[key]
+                    else:
+                        feed_dict[key] = value
+
+        if file is None and not changed:
+            logging.info('Episode numbers unchanged, not writing')
+            return
 
-        text = json.dumps(self.config, indent=4)
+        logging.info('Writing episode numbers')
+        data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
         if file is None:
-            await write_text(self.path, text)
+            await write_bytes(self.path, data)
         else:
-            file.write(text)
+            file.write(data)
 
     async def run(self) -> None:
         await self.check_feeds()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+import shutil
 import asyncio
 import subprocess
 from os import PathLike
@@ -15,7 +16,8 @@ from typing import (
     Any,
     TypeVar,
     Callable,
-    Coroutine
+    Coroutine,
+    cast
 )
 
 from aiofile import AIOFile
@@ -76,15 +78,33 @@ async def show_exception_notification(exception: Exception) -> None:
         pass
 
 
-async def read_text(path: PathLike) -> str:
-    async with AIOFile(path) as file:
-        return await file.read()
+async def read_bytes(path: PathLike) -> bytes:
+    async with AIOFile(path, mode='rb') as file:
+        return cast(bytes, await file.read())
 
 
-async def write_text(path: PathLike, text: str) -> None:
-    async with AIOFile(path, mode='w') as file:
-        await file.write(text)
-        await file.fsync()
+async def write_bytes(path: PathLike, data: bytes) -> None:
+    # written to a temporary file which then replaces the original, so that
+    # an interrupted write never leaves the original half written. symlinks
+    # are followed so that the link itself isn't replaced with a file, and the
+    # original's permissions are copied before anything is written.
+    real_path = os.path.realpath(path)
+    temp_path = f'{real_path}.tmp'
+    try:
+        async with AIOFile(temp_path, mode='wb') as file:
+            try:
+                shutil.copymode(real_path, temp_path)
+            except FileNotFoundError:
+                pass
+            await file.write(data)
+            await file.fsync()
+        os.replace(temp_path, real_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 async def open_with_default_application(url: str) -> None: